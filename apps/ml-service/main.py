@@ -1,23 +1,97 @@
 """
 ML Service for Stock Price Prediction using LSTM
 """
+import time
+
+_IMPORT_START = time.perf_counter()
+
+import asyncio
+import importlib
+import logging
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from typing import List, Dict, Optional
-import numpy as np
+from typing import Any, List, Dict, Optional
 from datetime import datetime
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("ml-service")
+
+STARTUP_MODES = {"lazy", "eager"}
+
+
+def parse_startup_mode(value: str) -> str:
+    """Validate STARTUP_MODE, rejecting anything but lazy or eager"""
+    mode = value.strip().lower()
+    if mode not in STARTUP_MODES:
+        raise ValueError(
+            f"Invalid STARTUP_MODE {value!r}, expected one of: "
+            + ", ".join(sorted(STARTUP_MODES))
+        )
+    return mode
+
+
+# Startup mode: "lazy" serves /health immediately and warms up heavy ML
+# dependencies in the background, retrying failures with backoff; "eager"
+# finishes warm-up before serving and fails startup if warm-up fails.
+STARTUP_MODE = parse_startup_mode(os.getenv("STARTUP_MODE", "lazy"))
+
+# Backoff between warm-up retries in lazy mode, in seconds
+WARMUP_RETRY_DELAY = float(os.getenv("WARMUP_RETRY_DELAY", "1"))
+WARMUP_RETRY_MAX_DELAY = float(os.getenv("WARMUP_RETRY_MAX_DELAY", "60"))
+
+# Heavy modules imported during warm-up (e.g. numpy,pandas,sklearn,ta,tensorflow)
+WARMUP_MODULES = [
+    name.strip()
+    for name in os.getenv("WARMUP_MODULES", "numpy").split(",")
+    if name.strip()
+]
+
+# Startup timing breakdown in milliseconds, reported by /health.
+# Only written from the event loop; handlers return copies.
+startup_timings: Dict[str, float] = {}
+warmup_errors: Dict[str, str] = {}
+ready = False
+
+_heavy_modules: Dict[str, Any] = {}
+
+
+def _elapsed_ms(since: float) -> float:
+    return round((time.perf_counter() - since) * 1000, 2)
+
+
+def lazy_import(name: str) -> Any:
+    """Import a heavy dependency on first use (blocking, run off the loop)"""
+    module = _heavy_modules.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+        _heavy_modules[name] = module
+    return module
+
+
+async def import_heavy(name: str) -> Any:
+    """Import a heavy dependency in a worker thread and record its timing"""
+    if name in _heavy_modules:
+        return _heavy_modules[name]
+    started = time.perf_counter()
+    module = await asyncio.to_thread(lazy_import, name)
+    startup_timings.setdefault(f"import_{name}_ms", _elapsed_ms(started))
+    return module
+
+
 app = FastAPI(
     title="Stock Prediction ML Service",
     description="LSTM-based stock price prediction API",
     version="1.0.0"
 )
 
+startup_timings["app_import_ms"] = _elapsed_ms(_IMPORT_START)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -47,17 +121,92 @@ class ModelInfoResponse(BaseModel):
     accuracy: Dict
     supported_symbols: List[str]
 
-# Global model instance (will be loaded on startup)
+# Global model instance (loaded during warm-up)
 model_instance = None
+warmup_task: Optional[asyncio.Task] = None
+
+
+def load_models():
+    """Load ML models (blocking, run off the loop)"""
+    # TODO: Load actual trained models
+    logger.info("Loading ML models...")
+    models = {"status": "mock"}  # Placeholder
+    logger.info("ML models loaded")
+    return models
+
+
+async def _warm_up_once() -> Dict[str, str]:
+    """Run one warm-up attempt, skipping steps that already succeeded"""
+    global model_instance
+    errors: Dict[str, str] = {}
+    for name in WARMUP_MODULES:
+        try:
+            await import_heavy(name)
+        except Exception as e:
+            errors[name] = str(e)
+            logger.error("Failed to import %s: %s", name, e)
+    if model_instance is None:
+        started = time.perf_counter()
+        try:
+            model_instance = await asyncio.to_thread(load_models)
+            startup_timings["model_load_ms"] = _elapsed_ms(started)
+        except Exception as e:
+            errors["models"] = str(e)
+            logger.error("Failed to load ML models: %s", e)
+    return errors
+
+
+async def warm_up(retry: bool = True):
+    """Import heavy ML dependencies and load models off the event loop.
+
+    With retry, failed steps are retried with exponential backoff until
+    they succeed; without it, the first failure raises RuntimeError.
+    """
+    global ready
+    started = time.perf_counter()
+    delay = WARMUP_RETRY_DELAY
+    attempt = 1
+    while True:
+        errors = await _warm_up_once()
+        warmup_errors.clear()
+        warmup_errors.update(errors)
+        if not errors:
+            break
+        if not retry:
+            raise RuntimeError(f"ML warm-up failed: {errors}")
+        logger.warning(
+            "ML warm-up attempt %d failed, retrying in %.1fs", attempt, delay
+        )
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, WARMUP_RETRY_MAX_DELAY)
+        attempt += 1
+    startup_timings["warmup_ms"] = _elapsed_ms(started)
+    startup_timings["ready_ms"] = _elapsed_ms(_IMPORT_START)
+    ready = True
+    logger.info("ML warm-up complete in %.0fms", startup_timings["warmup_ms"])
+
 
 @app.on_event("startup")
 async def startup_event():
-    """Load ML models on startup"""
-    global model_instance
-    # TODO: Load actual trained models
-    print(" Loading ML models...")
-    model_instance = {"status": "mock"}  # Placeholder
-    print(" ML models loaded")
+    """Warm up ML dependencies, in the background unless STARTUP_MODE=eager"""
+    global warmup_task
+    startup_timings["startup_ms"] = _elapsed_ms(_IMPORT_START)
+    if STARTUP_MODE == "eager":
+        await warm_up(retry=False)
+    else:
+        warmup_task = asyncio.create_task(warm_up())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Cancel a warm-up that is still running"""
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+        try:
+            await warmup_task
+        except asyncio.CancelledError:
+            pass
+
 
 @app.get("/")
 async def root():
@@ -71,16 +220,34 @@ async def root():
 
 @app.get("/health")
 async def health():
-    """Detailed health check"""
+    """Liveness check with startup timing breakdown"""
     return {
         "status": "healthy",
+        "ready": ready,
+        "startup_mode": STARTUP_MODE,
+        "model_loaded": model_instance is not None,
+        "startup_timings": dict(startup_timings),
+        "warmup_errors": dict(warmup_errors),
+        "timestamp": datetime.now().isoformat()
+    }
+
+@app.get("/ready")
+async def readiness():
+    """Readiness check, returns 503 until warm-up has completed"""
+    body = {
+        "ready": ready,
         "model_loaded": model_instance is not None,
+        "warmup_errors": dict(warmup_errors),
         "timestamp": datetime.now().isoformat()
     }
+    return JSONResponse(status_code=200 if ready else 503, content=body)
 
 @app.post("/predict", response_model=PredictionResponse)
 async def predict(request: PredictionRequest):
     """Generate price predictions for a stock symbol"""
+    if not ready:
+        raise HTTPException(status_code=503, detail="ML models are warming up")
+    np = await import_heavy("numpy")
     try:
         symbol = request.symbol.upper()
         
@@ -0,0 +1,114 @@
+"""
+Tests for ML service startup modes, liveness and readiness
+"""
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+@pytest.fixture(autouse=True)
+def reset_state(monkeypatch):
+    """Give every test a cold service"""
+    monkeypatch.setattr(main, "ready", False)
+    monkeypatch.setattr(main, "model_instance", None)
+    monkeypatch.setattr(main, "warmup_task", None)
+    monkeypatch.setattr(
+        main,
+        "startup_timings",
+        {"app_import_ms": main.startup_timings["app_import_ms"]},
+    )
+    monkeypatch.setattr(main, "warmup_errors", {})
+    monkeypatch.setattr(main, "_heavy_modules", {})
+    monkeypatch.setattr(main, "WARMUP_MODULES", ["numpy"])
+    monkeypatch.setattr(main, "WARMUP_RETRY_DELAY", 0.01)
+    monkeypatch.setattr(main, "WARMUP_RETRY_MAX_DELAY", 0.05)
+
+
+def wait_until_ready(client, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        response = client.get("/ready")
+        if response.status_code == 200:
+            return response
+        time.sleep(0.01)
+    pytest.fail("service did not become ready")
+
+
+def test_parse_startup_mode():
+    assert main.parse_startup_mode("lazy") == "lazy"
+    assert main.parse_startup_mode(" EAGER ") == "eager"
+    with pytest.raises(ValueError):
+        main.parse_startup_mode("eagre")
+
+
+def test_lazy_mode_serves_health_before_warm_up(monkeypatch):
+    monkeypatch.setattr(main, "STARTUP_MODE", "lazy")
+    release = threading.Event()
+    load_models = main.load_models
+
+    def slow_load_models():
+        release.wait(5)
+        return load_models()
+
+    monkeypatch.setattr(main, "load_models", slow_load_models)
+
+    with TestClient(main.app) as client:
+        try:
+            health = client.get("/health")
+            assert health.status_code == 200
+            assert health.json()["ready"] is False
+            assert client.get("/ready").status_code == 503
+            predict = client.post("/predict", json={"symbol": "aapl"})
+            assert predict.status_code == 503
+        finally:
+            release.set()
+
+        assert wait_until_ready(client).json()["ready"] is True
+        timings = client.get("/health").json()["startup_timings"]
+        for key in (
+            "app_import_ms",
+            "startup_ms",
+            "import_numpy_ms",
+            "model_load_ms",
+            "warmup_ms",
+            "ready_ms",
+        ):
+            assert key in timings
+        assert client.post("/predict", json={"symbol": "aapl"}).status_code == 200
+
+
+def test_lazy_mode_retries_failed_warm_up(monkeypatch):
+    monkeypatch.setattr(main, "STARTUP_MODE", "lazy")
+    monkeypatch.setattr(main, "WARMUP_MODULES", ["numpy", "no_such_module"])
+
+    with TestClient(main.app) as client:
+        deadline = time.monotonic() + 5
+        while "no_such_module" not in client.get("/health").json()["warmup_errors"]:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert client.get("/ready").status_code == 503
+
+        main.WARMUP_MODULES.remove("no_such_module")
+        body = wait_until_ready(client).json()
+        assert body["warmup_errors"] == {}
+
+
+def test_eager_mode_finishes_warm_up_before_serving(monkeypatch):
+    monkeypatch.setattr(main, "STARTUP_MODE", "eager")
+
+    with TestClient(main.app) as client:
+        assert client.get("/ready").status_code == 200
+        assert "ready_ms" in client.get("/health").json()["startup_timings"]
+
+
+def test_eager_mode_fails_startup_on_warm_up_error(monkeypatch):
+    monkeypatch.setattr(main, "STARTUP_MODE", "eager")
+    monkeypatch.setattr(main, "WARMUP_MODULES", ["no_such_module"])
+
+    with pytest.raises(RuntimeError):
+        with TestClient(main.app):
+            pass